@@ -0,0 +1,68 @@
+# cython: language_level=3
+"""
+Optional compiled price parser.
+
+Mirrors the single-pass algorithm of price_v2.normalize_price_to_float
+but runs the scan in C, which matters once prices are parsed per-row in
+a batch instead of once per click. Build in place with:
+
+    python setup.py build_ext --inplace
+
+price_v2 falls back to the pure-Python parser when this extension
+isn't built, so building it is never required.
+"""
+
+def parse_price(text):
+    """
+    Parse a price string like "1.234,56 TL" or "1,234.56" into a float.
+
+    Digits are kept; whichever separator ('.' or ',') occurs last is
+    the decimal point, earlier ones are thousands separators. Returns
+    None when no digits are found. Only handles inputs shorter than 64
+    characters; the caller falls back to Python for longer ones.
+    """
+    cdef Py_ssize_t i, n = len(text)
+    cdef Py_ssize_t out_n = 0, digits = 0, m = 0
+    cdef Py_ssize_t last_dot = -1, last_comma = -1, dec_pos
+    cdef Py_UCS4 ch
+    cdef char kept[64]
+    cdef char out[64]
+
+    if n == 0 or n >= 64:
+        return None
+
+    for i in range(n):
+        ch = text[i]
+        if u"0" <= ch <= u"9":
+            kept[out_n] = <char> ch
+            out_n += 1
+            digits += 1
+        elif ch == u".":
+            last_dot = out_n
+            kept[out_n] = b"."
+            out_n += 1
+        elif ch == u",":
+            last_comma = out_n
+            kept[out_n] = b","
+            out_n += 1
+
+    if digits == 0:
+        return None
+
+    dec_pos = last_dot if last_dot > last_comma else last_comma
+
+    for i in range(out_n):
+        if kept[i] == b"." or kept[i] == b",":
+            if i == dec_pos:
+                out[m] = b"."
+                m += 1
+            # Earlier separators are thousands separators: skip them
+        else:
+            out[m] = kept[i]
+            m += 1
+
+    # Convert through Python's float(), which always uses '.' as the
+    # decimal point. C atof() would honor LC_NUMERIC here, and Qt sets
+    # the process locale on startup — under tr_TR that makes atof stop
+    # at the '.' and silently drop the fraction.
+    return float(out[:m])
@@ -1,360 +1,918 @@
-"""
-Amazon Price Tracker (PyQt5 + Selenium) 
-
-A small desktop app that:
-- Takes an Amazon product URL
-- Opens the page with Selenium
-- Extracts product title + price with BeautifulSoup
-- Optionally alerts when the price is below a target value
-- Saves results to a CSV file
-
-Notes:
-- This is a learning project. The UI may freeze briefly while fetching (no threading).
-- Amazon may show bot checks/captcha; in that case price parsing can fail.
-"""
-
-import sys
-import os
-import csv
-import re
-import time
-from datetime import datetime
-
-from PyQt5.QtWidgets import (
-    QApplication,
-    QWidget,
-    QLabel,
-    QLineEdit,
-    QPushButton,
-    QVBoxLayout,
-    QHBoxLayout,
-    QSpinBox,
-    QTextEdit,
-    QMessageBox,
-    QGroupBox,
-)
-
-from bs4 import BeautifulSoup
-
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import WebDriverException, TimeoutException
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-
-from webdriver_manager.chrome import ChromeDriverManager
-
-
-# ----------------------------
-# Small helper functions
-# ----------------------------
-def now_str() -> str:
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-
-def ensure_data_dir():
-    # Create a local folder for CSV logs if it doesn't exist
-    os.makedirs("data", exist_ok=True)
-
-
-def append_history_csv(url: str, title: str, price: float, raw_price: str):
-    # Append a new row into data/price_history.csv
-    ensure_data_dir()
-    path = os.path.join("data", "price_history.csv")
-    file_exists = os.path.exists(path)
-
-    with open(path, "a", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        if not file_exists:
-            w.writerow(["timestamp", "url", "title", "price", "raw_price"])
-        w.writerow([now_str(), url, title, price, raw_price])
-
-
-def normalize_price_to_float(text: str):
-    """
-    A simple price parser that tries to convert strings like:
-    - "1.234,56 TL"
-    - "1,234.56"
-    into float.
-
-    This is heuristic-based and may fail on some formats.
-    """
-    if not text:
-        return None
-
-    cleaned = re.sub(r"[^\d\.,]", "", text).strip()
-    if not cleaned:
-        return None
-
-    # If both separators exist, decide the decimal separator by the last occurrence
-    if "." in cleaned and "," in cleaned:
-        if cleaned.rfind(",") > cleaned.rfind("."):
-            # decimal is ','  thousands is '.'
-            cleaned = cleaned.replace(".", "")
-            cleaned = cleaned.replace(",", ".")
-        else:
-            # decimal is '.'  thousands is ','
-            cleaned = cleaned.replace(",", "")
-    else:
-        # Only comma exists: often decimal in TR/EU style
-        if "," in cleaned:
-            cleaned = cleaned.replace(".", "")
-            cleaned = cleaned.replace(",", ".")
-        # Only dot exists: assume it can be decimal; keep as-is
-
-    try:
-        return float(cleaned)
-    except ValueError:
-        return None
-
-
-# ----------------------------
-# Selenium fetch 
-# ----------------------------
-def fetch_amazon_price(url: str, timeout_sec: int = 20, headless: bool = True):
-    """
-    Fetch title and price from an Amazon product page.
-
-    Returns a dict with:
-    - url, title, price, price_text, currency_hint
-    Raises an Exception if parsing fails.
-    """
-    options = webdriver.ChromeOptions()
-    options.add_argument("--window-size=1200,900")
-
-    # Headless mode runs Chrome without showing a window
-    if headless:
-        options.add_argument("--headless=new")
-
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-
-    try:
-        driver.get(url)
-
-        # Wait for the page body to exist
-        WebDriverWait(driver, timeout_sec).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-
-        # Small delay for dynamic elements
-        time.sleep(1.2)
-
-        soup = BeautifulSoup(driver.page_source, "lxml")
-
-        # Try common title selectors
-        title = ""
-        title_el = soup.select_one("#productTitle") or soup.select_one("h1#title")
-        if title_el:
-            title = title_el.get_text(" ", strip=True)
-
-        # Try common Amazon price selectors
-        price_text = None
-        candidates = [
-            "#priceblock_ourprice",
-            "#priceblock_dealprice",
-            "#priceblock_saleprice",
-            "span.a-price span.a-offscreen",
-            "#corePriceDisplay_desktop_feature_div span.a-price span.a-offscreen",
-            "#corePrice_feature_div span.a-price span.a-offscreen",
-        ]
-
-        for sel in candidates:
-            el = soup.select_one(sel)
-            if el:
-                t = el.get_text(" ", strip=True)
-                if t:
-                    price_text = t
-                    break
-
-        if not price_text:
-            raise RuntimeError(
-                "Price element not found. The page layout may be different or blocked by Amazon."
-            )
-
-        currency_hint = re.sub(r"[\d\.,\s]", "", price_text).strip()
-        price_val = normalize_price_to_float(price_text)
-
-        if price_val is None:
-            raise RuntimeError(
-                "Price could not be parsed. The content may be blocked or the format is unexpected."
-            )
-
-        return {
-            "url": url,
-            "title": title,
-            "price": price_val,
-            "price_text": price_text,
-            "currency_hint": currency_hint,
-        }
-
-    finally:
-        try:
-            driver.quit()
-        except Exception:
-            pass
-
-
-# ----------------------------
-# GUI
-# ----------------------------
-class MainWindow(QWidget):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Amazon Price Tracker")
-        self.setMinimumWidth(760)
-
-        self.last_result = None
-
-        self.url_input = QLineEdit()
-        self.url_input.setPlaceholderText(
-            "Paste an Amazon product URL (e.g. https://www.amazon.com.tr/dp/...)"
-        )
-
-        self.target_price = QSpinBox()
-        self.target_price.setRange(0, 10_000_000)
-        self.target_price.setValue(0)
-        self.target_price.setSuffix(" target price")
-
-        self.timeout_input = QSpinBox()
-        self.timeout_input.setRange(5, 120)
-        self.timeout_input.setValue(20)
-        self.timeout_input.setSuffix(" sec timeout")
-
-        self.headless_btn = QPushButton("Headless: ON")
-        self.headless_btn.setCheckable(True)
-        self.headless_btn.setChecked(True)
-        self.headless_btn.clicked.connect(self.toggle_headless)
-
-        self.fetch_btn = QPushButton("Fetch Price")
-        self.fetch_btn.clicked.connect(self.fetch_price)
-
-        self.save_btn = QPushButton("Save to CSV")
-        self.save_btn.setEnabled(False)
-        self.save_btn.clicked.connect(self.save_history)
-
-        self.title_lbl = QLabel("Product: —")
-        self.price_lbl = QLabel("Price: —")
-        self.price_lbl.setStyleSheet("font-size: 16px; font-weight: 600;")
-
-        self.log_box = QTextEdit()
-        self.log_box.setReadOnly(True)
-
-        # Layout
-        top = QGroupBox("Input")
-        top_l = QVBoxLayout()
-
-        row1 = QHBoxLayout()
-        row1.addWidget(QLabel("URL:"))
-        row1.addWidget(self.url_input)
-
-        row2 = QHBoxLayout()
-        row2.addWidget(QLabel("Settings:"))
-        row2.addWidget(self.target_price)
-        row2.addWidget(self.timeout_input)
-        row2.addWidget(self.headless_btn)
-        row2.addStretch()
-        row2.addWidget(self.fetch_btn)
-        row2.addWidget(self.save_btn)
-
-        top_l.addLayout(row1)
-        top_l.addLayout(row2)
-        top.setLayout(top_l)
-
-        out = QGroupBox("Output")
-        out_l = QVBoxLayout()
-        out_l.addWidget(self.title_lbl)
-        out_l.addWidget(self.price_lbl)
-        out_l.addWidget(self.log_box)
-        out.setLayout(out_l)
-
-        main_l = QVBoxLayout()
-        main_l.addWidget(top)
-        main_l.addWidget(out)
-        self.setLayout(main_l)
-
-    def toggle_headless(self):
-        self.headless_btn.setText("Headless: ON" if self.headless_btn.isChecked() else "Headless: OFF")
-
-    def log(self, msg: str):
-        self.log_box.append(msg)
-
-    def fetch_price(self):
-        url = self.url_input.text().strip()
-        if not url or "amazon" not in url.lower():
-            QMessageBox.warning(self, "Invalid URL", "Please enter a valid Amazon product URL.")
-            return
-
-        # Reset UI state
-        self.fetch_btn.setEnabled(False)
-        self.save_btn.setEnabled(False)
-        self.title_lbl.setText("Product: —")
-        self.price_lbl.setText("Price: —")
-        self.last_result = None
-
-        timeout = int(self.timeout_input.value())
-        headless = bool(self.headless_btn.isChecked())
-
-        self.log(f"[{now_str()}] Fetching page... (UI may freeze briefly)")
-
-        try:
-            data = fetch_amazon_price(url=url, timeout_sec=timeout, headless=headless)
-
-            title = data.get("title") or "(title not found)"
-            price = data.get("price")
-            price_text = data.get("price_text") or ""
-            currency = data.get("currency_hint") or ""
-
-            self.last_result = data
-
-            self.title_lbl.setText(f"Product: {title}")
-            self.price_lbl.setText(f"Price: {price}  |  (raw: {price_text})")
-            self.log(f"[{now_str()}] OK — parsed price: {price} {currency}".strip())
-
-            self.save_btn.setEnabled(True)
-
-            # Target price alert
-            target = int(self.target_price.value())
-            if target > 0 and price is not None and price <= target:
-                QMessageBox.information(
-                    self,
-                    "Target Reached!",
-                    f"Price is below your target.\n\nTarget: {target}\nCurrent: {price} {currency}".strip(),
-                )
-
-        except TimeoutException:
-            self.log(f"[{now_str()}] ERROR — Timeout while loading the page.")
-            QMessageBox.critical(self, "Error", "Timeout: page is slow or blocked.")
-        except WebDriverException as e:
-            self.log(f"[{now_str()}] ERROR — WebDriver issue: {e}")
-            QMessageBox.critical(self, "Error", f"Selenium/WebDriver error:\n{e}")
-        except Exception as e:
-            self.log(f"[{now_str()}] ERROR — {e}")
-            QMessageBox.critical(self, "Error", str(e))
-        finally:
-            self.fetch_btn.setEnabled(True)
-
-    def save_history(self):
-        if not self.last_result:
-            return
-
-        url = self.last_result["url"]
-        title = self.last_result.get("title", "")
-        price = self.last_result.get("price", "")
-        raw_price = self.last_result.get("price_text", "")
-
-        append_history_csv(url, title, price, raw_price)
-        self.log(f"[{now_str()}] Saved to data/price_history.csv")
-        QMessageBox.information(self, "Saved", "Saved to CSV (data/price_history.csv).")
-
-
-def main():
-    app = QApplication(sys.argv)
-    w = MainWindow()
-    w.show()
-    sys.exit(app.exec_())
-
-
-if __name__ == "__main__":
-    main()
+"""
+Amazon Price Tracker (PyQt5 + Selenium) 
+
+A small desktop app that:
+- Takes an Amazon product URL
+- Opens the page with Selenium
+- Extracts product title + price with lxml
+- Optionally alerts when the price is below a target value
+- Saves results to a CSV file
+
+Notes:
+- This is a learning project. Fetching runs on a small thread pool so the UI stays responsive.
+- Amazon may show bot checks/captcha; in that case price parsing can fail.
+"""
+
+import sys
+import os
+import csv
+import re
+import itertools
+from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QMutex, pyqtSignal
+from PyQt5.QtWidgets import (
+    QApplication,
+    QWidget,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QVBoxLayout,
+    QHBoxLayout,
+    QSpinBox,
+    QTextEdit,
+    QMessageBox,
+    QGroupBox,
+)
+
+from lxml import html as lxml_html
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import (
+    WebDriverException,
+    TimeoutException,
+    InvalidSessionIdException,
+    NoSuchElementException,
+)
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+try:
+    import httpx
+except ImportError:
+    # The HTTP fast path is optional; everything still works through
+    # Selenium without it
+    httpx = None
+
+try:
+    from _price_parser import parse_price as _parse_price_c
+except ImportError:
+    # Compiled parser not built (see _price_parser.pyx / setup.py);
+    # the pure-Python implementation is used instead
+    _parse_price_c = None
+
+
+# In-browser CSS queries used on the happy path: asking Chrome for the
+# one node we need avoids shipping the whole page source over the CDP
+# socket and reparsing it in Python.
+_TITLE_SEL = "#productTitle, h1#title"
+_PRICE_SEL = (
+    "#priceblock_ourprice, #priceblock_dealprice, #priceblock_saleprice, "
+    "span.a-price span.a-offscreen"
+)
+
+# XPath fallbacks, precompiled once at import time; compiling them per
+# fetch (or letting BeautifulSoup re-tokenize CSS selectors per call)
+# was a measurable chunk of the extraction stage on 1-3 MB Amazon pages.
+_TITLE_XPATH = lxml_html.etree.XPath("(//*[@id='productTitle']|//h1[@id='title'])[1]")
+# Two compound queries instead of six separate ones: the specific
+# priceblock ids keep strict priority over the generic offscreen span,
+# and each pass walks the document only once. The old per-container
+# corePrice* selectors were subsets of the generic span query, so the
+# union covers them.
+_PRICE_XPATHS = (
+    lxml_html.etree.XPath(
+        "//*[@id='priceblock_ourprice' or @id='priceblock_dealprice'"
+        " or @id='priceblock_saleprice']"
+    ),
+    lxml_html.etree.XPath(
+        "//span[contains(@class, 'a-price')]//span[@class='a-offscreen']"
+    ),
+)
+
+# Precompiled once like the XPaths above; strips digits and separators
+# to leave just the currency symbol.
+_CURRENCY_HINT_RE = re.compile(r"[\d\.,\s]")
+
+
+# Amazon storefront domains the tracker accepts. Matching the parsed
+# hostname (instead of substring-searching the whole URL) also rejects
+# things like https://evil.com/?x=amazon
+_ALLOWED_HOSTS = (
+    "amazon.com",
+    "amazon.com.tr",
+    "amazon.de",
+    "amazon.co.uk",
+    "amazon.fr",
+    "amazon.it",
+    "amazon.es",
+    "amazon.nl",
+    "amazon.be",
+    "amazon.se",
+    "amazon.pl",
+    "amazon.ie",
+    "amazon.ca",
+    "amazon.com.mx",
+    "amazon.com.br",
+    "amazon.co.jp",
+    "amazon.cn",
+    "amazon.in",
+    "amazon.sg",
+    "amazon.com.au",
+    "amazon.ae",
+    "amazon.sa",
+    "amazon.eg",
+    "amazon.co.za",
+)
+
+
+# ----------------------------
+# Small helper functions
+# ----------------------------
+def now_str() -> str:
+    # Same "YYYY-MM-DD HH:MM:SS" string as strftime("%Y-%m-%d %H:%M:%S")
+    # would give, but isoformat is a C-level fast path
+    return datetime.now().isoformat(sep=" ", timespec="seconds")
+
+
+def is_amazon_url(url: str) -> bool:
+    # True if the URL's host is one of the known Amazon storefronts
+    # (or a subdomain like www.amazon.com.tr)
+    try:
+        host = (urlsplit(url).hostname or "").lower()
+    except ValueError:
+        return False
+    return any(host == h or host.endswith("." + h) for h in _ALLOWED_HOSTS)
+
+
+def ensure_data_dir():
+    # Create local folders for CSV logs and the browser profile/cache
+    # if they don't exist
+    os.makedirs("data", exist_ok=True)
+    os.makedirs(_PROFILE_ROOT, exist_ok=True)
+    os.makedirs(_CACHE_ROOT, exist_ok=True)
+
+
+_CSV_PATH = os.path.join("data", "price_history.csv")
+_CSV_HEADER = ("timestamp", "url", "title", "price", "raw_price")
+
+# History file handle, opened lazily on first save and kept open so
+# repeated saves don't pay stat+open+close per row
+_csv_file = None
+_csv_writer = None
+
+
+def _get_csv_writer():
+    global _csv_file, _csv_writer
+    if _csv_writer is None:
+        ensure_data_dir()
+        write_header = not os.path.exists(_CSV_PATH)
+        _csv_file = open(_CSV_PATH, "a", newline="", encoding="utf-8")
+        _csv_writer = csv.writer(_csv_file)
+        if write_header:
+            _csv_writer.writerow(_CSV_HEADER)
+    return _csv_writer
+
+
+def append_history_csv(url: str, title: str, price: float, raw_price: str, timestamp=None):
+    # Append a new row into data/price_history.csv
+    if timestamp is None:
+        timestamp = now_str()
+    _get_csv_writer().writerow([timestamp, url, title, price, raw_price])
+    _csv_file.flush()
+
+
+def append_history_csv_many(entries):
+    # Append many (url, title, price, raw_price) rows in one buffered
+    # write; the whole batch shares a single timestamp
+    timestamp = now_str()
+    _get_csv_writer().writerows([timestamp, *entry] for entry in entries)
+    _csv_file.flush()
+
+
+def close_history_csv():
+    global _csv_file, _csv_writer
+    if _csv_file is not None:
+        try:
+            _csv_file.close()
+        except Exception:
+            pass
+        _csv_file = None
+        _csv_writer = None
+
+
+@lru_cache(maxsize=512)
+def normalize_price_to_float(text: str):
+    """
+    A simple price parser that tries to convert strings like:
+    - "1.234,56 TL"
+    - "1,234.56"
+    into float.
+
+    This is heuristic-based and may fail on some formats. Results are
+    memoized: a tracker tends to see the same price string over and
+    over, so repeats become a dict lookup.
+
+    Single pass over the text: digits are kept, and whichever separator
+    ('.' or ',') occurs last is treated as the decimal point; earlier
+    separators are dropped as thousands separators.
+    """
+    if not text:
+        return None
+
+    if _parse_price_c is not None and len(text) < 64:
+        return _parse_price_c(text)
+
+    kept = []
+    last_dot = last_comma = -1
+    for ch in text:
+        if "0" <= ch <= "9":
+            kept.append(ch)
+        elif ch == ".":
+            last_dot = len(kept)
+            kept.append(ch)
+        elif ch == ",":
+            last_comma = len(kept)
+            kept.append(ch)
+
+    if not kept:
+        return None
+
+    dec_pos = max(last_dot, last_comma)
+    cleaned = []
+    for i, ch in enumerate(kept):
+        if ch == "." or ch == ",":
+            if i == dec_pos:
+                cleaned.append(".")
+            # Earlier separators are thousands separators: skip them
+        else:
+            cleaned.append(ch)
+
+    try:
+        return float("".join(cleaned))
+    except ValueError:
+        return None
+
+
+def _extract_from_tree(tree):
+    # Pull (title, price_text) out of a parsed lxml tree; either may be
+    # empty/None if the page doesn't have the expected nodes
+    title = ""
+    title_els = _TITLE_XPATH(tree)
+    if title_els:
+        title = title_els[0].text_content().strip()
+
+    price_text = None
+    for xpath in _PRICE_XPATHS:
+        els = xpath(tree)
+        if els:
+            t = els[0].text_content().strip()
+            if t:
+                price_text = t
+                break
+
+    return title, price_text
+
+
+# ----------------------------
+# HTTP fast path
+# ----------------------------
+# Amazon often serves the offscreen price span in the initial HTML, in
+# which case a plain HTTP GET plus lxml parse (a few hundred ms) does
+# the job of a full browser navigation (several seconds). The client is
+# shared so keep-alive connections are reused across fetches.
+_HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "tr-TR,tr;q=0.9,en;q=0.8",
+}
+
+# Markers of Amazon's bot-check page; when present the HTML has no real
+# price and the browser path should take over
+_CAPTCHA_MARKERS = ("validatecaptcha", "robot check", "api-services-support@amazon.com")
+
+_http_client = None
+
+
+def _get_http_client():
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            headers=_HTTP_HEADERS, timeout=10, follow_redirects=True
+        )
+    return _http_client
+
+
+def try_http_first(url: str):
+    """
+    Try to read title and price from the server-rendered HTML.
+
+    Returns the same dict as fetch_amazon_price on success, or None when
+    the page needs a real browser (price not in the HTML, captcha page,
+    request failed, or httpx isn't installed).
+    """
+    if httpx is None:
+        return None
+
+    try:
+        resp = _get_http_client().get(url)
+    except Exception:
+        return None
+
+    if resp.status_code != 200:
+        return None
+
+    text = resp.text
+    lowered = text.lower()
+    if any(marker in lowered for marker in _CAPTCHA_MARKERS):
+        return None
+
+    title, price_text = _extract_from_tree(lxml_html.fromstring(text))
+    if not price_text:
+        return None
+
+    price_val = normalize_price_to_float(price_text)
+    if price_val is None:
+        return None
+
+    return {
+        "url": url,
+        "title": title,
+        "price": price_val,
+        "price_text": price_text,
+        "currency_hint": _CURRENCY_HINT_RE.sub("", price_text).strip(),
+    }
+
+
+# Startup features Chrome doesn't need for scraping a single page:
+# GPU process, extensions, component updater, sync, translate and the
+# various background/phone-home services each add startup time and
+# continuous background CPU.
+_CHROME_STARTUP_FLAGS = (
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-features=Translate,BackForwardCache,MediaRouter,OptimizationHints",
+)
+
+# Resource patterns Chrome is told not to download. Images, video, fonts
+# and ad/tracking scripts make up most of an Amazon page's transfer size
+# but none of them are needed to read the title and price.
+_BLOCKED_URL_PATTERNS = (
+    "*.jpg",
+    "*.jpeg",
+    "*.png",
+    "*.webp",
+    "*.gif",
+    "*.svg",
+    "*.mp4",
+    "*.woff*",
+    "*doubleclick*",
+    "*googlesyndication*",
+    "*amazon-adsystem*",
+)
+
+
+# ----------------------------
+# Selenium fetch
+# ----------------------------
+# Persistent profile and disk cache so Chrome's HTTP cache survives
+# across fetches and app runs (Amazon's static CSS/JS bundles are
+# long-lived cacheable). Chrome locks its profile dir, so each
+# concurrently running driver gets its own numbered slot.
+_PROFILE_ROOT = os.path.join("data", "chrome-profile")
+_CACHE_ROOT = os.path.join("data", "chrome-cache")
+_profile_slots = itertools.count()
+
+_CACHED_DRIVER_PATH = None
+_DRIVER_PATH_FILE = os.path.join("data", ".driver_path")
+
+
+def _driver_path():
+    """
+    Resolve the chromedriver binary once and remember it.
+
+    ChromeDriverManager().install() does a version-check round-trip to
+    the driver CDN even when the driver is already on disk, so the
+    result is cached for the process and persisted to data/.driver_path
+    for the next launch.
+    """
+    global _CACHED_DRIVER_PATH
+    if _CACHED_DRIVER_PATH is not None:
+        return _CACHED_DRIVER_PATH
+
+    try:
+        with open(_DRIVER_PATH_FILE, encoding="utf-8") as f:
+            path = f.read().strip()
+        if path and os.path.exists(path):
+            _CACHED_DRIVER_PATH = path
+            return _CACHED_DRIVER_PATH
+    except OSError:
+        pass
+
+    _CACHED_DRIVER_PATH = ChromeDriverManager().install()
+    try:
+        ensure_data_dir()
+        with open(_DRIVER_PATH_FILE, "w", encoding="utf-8") as f:
+            f.write(_CACHED_DRIVER_PATH)
+    except OSError:
+        pass
+
+    return _CACHED_DRIVER_PATH
+
+
+def _build_chrome_options(
+    headless: bool = True, block_assets: bool = True, profile_slot: int = 0
+):
+    options = webdriver.ChromeOptions()
+    options.add_argument("--window-size=1200,900")
+
+    ensure_data_dir()
+    slot = f"slot-{profile_slot}"
+    options.add_argument(
+        "--user-data-dir=" + os.path.abspath(os.path.join(_PROFILE_ROOT, slot))
+    )
+    options.add_argument(
+        "--disk-cache-dir=" + os.path.abspath(os.path.join(_CACHE_ROOT, slot))
+    )
+    options.add_argument("--disk-cache-size=104857600")  # 100 MB
+
+    for flag in _CHROME_STARTUP_FLAGS:
+        options.add_argument(flag)
+
+    # Return from driver.get() at DOMContentLoaded instead of waiting
+    # for the full load event; the explicit price wait covers the rest
+    options.page_load_strategy = "eager"
+
+    # Headless mode runs Chrome without showing a window
+    if headless:
+        options.add_argument("--headless=new")
+
+    if block_assets:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        # Belt-and-suspenders image blocking that works even if the CDP
+        # call below is unavailable
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+
+    return options
+
+
+def _create_driver(headless: bool = True, block_assets: bool = True):
+    service = Service(_driver_path())
+    driver = webdriver.Chrome(
+        service=service,
+        options=_build_chrome_options(headless, block_assets, next(_profile_slots)),
+    )
+
+    if block_assets:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS)}
+            )
+        except WebDriverException:
+            # CDP isn't available on every driver/browser combo; the page
+            # still loads, just with all assets
+            pass
+
+    return driver
+
+
+def fetch_amazon_price(
+    url: str, timeout_sec: int = 20, headless: bool = True, block_assets: bool = True
+):
+    """
+    Fetch title and price from an Amazon product page.
+
+    Creates a throwaway browser for this one call; the GUI keeps warm
+    drivers around instead (see DriverPool). With block_assets (the
+    default) Chrome skips images, fonts and ad scripts, which cuts page
+    load time considerably.
+
+    Returns a dict with:
+    - url, title, price, price_text, currency_hint
+    Raises an Exception if parsing fails.
+    """
+    # Cheap attempt first: many pages serve the price in the initial
+    # HTML and don't need a browser at all
+    data = try_http_first(url)
+    if data is not None:
+        return data
+
+    driver = _create_driver(headless, block_assets)
+    try:
+        return _fetch_with(driver, url, timeout_sec)
+    finally:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+def _fetch_with(driver, url: str, timeout_sec: int = 20):
+    """Run the actual fetch + parse on an already-running driver."""
+    driver.get(url)
+
+    # Wait for the page body to exist
+    WebDriverWait(driver, timeout_sec).until(
+        EC.presence_of_element_located((By.TAG_NAME, "body"))
+    )
+
+    # Wait for a price element instead of sleeping a fixed amount: this
+    # returns as soon as the node exists (often immediately, since the
+    # price is usually in the initial HTML)
+    try:
+        WebDriverWait(driver, timeout_sec).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, _PRICE_SEL))
+        )
+    except TimeoutException:
+        # Fall through and let the parser decide; some layouts have no
+        # matching node at all (e.g. captcha pages)
+        pass
+
+    # Ask Chrome for the two nodes directly instead of serializing the
+    # whole page source into Python
+    title = ""
+    try:
+        title = driver.find_element(By.CSS_SELECTOR, _TITLE_SEL).text.strip()
+    except NoSuchElementException:
+        pass
+
+    price_text = None
+    try:
+        el = driver.find_element(By.CSS_SELECTOR, _PRICE_SEL)
+        price_text = el.get_attribute("textContent").strip() or None
+    except NoSuchElementException:
+        pass
+
+    if not price_text:
+        # Chrome can return an empty string for lazily rendered nodes;
+        # fall back to parsing the full page source with lxml
+        fb_title, price_text = _extract_from_tree(
+            lxml_html.fromstring(driver.page_source)
+        )
+        title = title or fb_title
+
+    if not price_text:
+        raise RuntimeError(
+            "Price element not found. The page layout may be different or blocked by Amazon."
+        )
+
+    currency_hint = _CURRENCY_HINT_RE.sub("", price_text).strip()
+    price_val = normalize_price_to_float(price_text)
+
+    if price_val is None:
+        raise RuntimeError(
+            "Price could not be parsed. The content may be blocked or the format is unexpected."
+        )
+
+    return {
+        "url": url,
+        "title": title,
+        "price": price_val,
+        "price_text": price_text,
+        "currency_hint": currency_hint,
+    }
+
+
+# ----------------------------
+# Background fetch workers
+# ----------------------------
+class DriverPool:
+    """
+    A small pool of warm Chrome drivers shared by the fetch workers.
+
+    Workers check a driver out, use it, and put it back, so parallel
+    fetches reuse already-running browsers instead of cold-starting one
+    per request.
+    """
+
+    def __init__(self):
+        self._mutex = QMutex()
+        self._idle = []  # list of (driver, headless) tuples
+        self._busy = []  # drivers currently checked out by workers
+
+    def acquire(self, headless: bool):
+        self._mutex.lock()
+        try:
+            for i, (driver, mode) in enumerate(self._idle):
+                if mode == headless:
+                    del self._idle[i]
+                    break
+            else:
+                driver = None
+        finally:
+            self._mutex.unlock()
+
+        if driver is not None:
+            # Reuse the warm driver, but clear cookies so sessions don't
+            # bleed between pages. A driver can die while sitting idle in
+            # the pool (e.g. the user closes a visible Chrome window); if
+            # the session is gone, quit the dead handle and start fresh
+            # instead of surfacing an error.
+            try:
+                driver.delete_all_cookies()
+            except WebDriverException:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+                driver = None
+
+        if driver is None:
+            driver = _create_driver(headless)
+
+        self._mutex.lock()
+        try:
+            self._busy.append(driver)
+        finally:
+            self._mutex.unlock()
+
+        return driver
+
+    def release(self, driver, headless: bool):
+        self._mutex.lock()
+        try:
+            if driver in self._busy:
+                self._busy.remove(driver)
+            self._idle.append((driver, headless))
+        finally:
+            self._mutex.unlock()
+
+    def discard(self, driver):
+        # Driver state is suspect (or the session is gone); quit it
+        # instead of returning it to the pool
+        if driver is None:
+            return
+        self._mutex.lock()
+        try:
+            if driver in self._busy:
+                self._busy.remove(driver)
+        finally:
+            self._mutex.unlock()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close_all(self):
+        # Quits checked-out drivers too: in-flight fetches fail fast
+        # instead of orphaning a Chrome + chromedriver pair on exit
+        self._mutex.lock()
+        try:
+            drivers = [d for d, _ in self._idle] + self._busy
+            self._idle = []
+            self._busy = []
+        finally:
+            self._mutex.unlock()
+
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+class WorkerSignals(QObject):
+    finished = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+
+class FetchWorker(QRunnable):
+    """Runs one price fetch off the Qt main thread and reports via signals."""
+
+    def __init__(self, pool: DriverPool, url: str, timeout_sec: int, headless: bool):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self._pool = pool
+        self._url = url
+        self._timeout_sec = timeout_sec
+        self._headless = headless
+
+    def run(self):
+        # Cheap attempt first: skip the browser when the server-rendered
+        # HTML already contains the price
+        data = try_http_first(self._url)
+        if data is not None:
+            self.signals.finished.emit(data)
+            return
+
+        driver = None
+        try:
+            driver = self._pool.acquire(self._headless)
+            try:
+                data = _fetch_with(driver, self._url, timeout_sec=self._timeout_sec)
+            except InvalidSessionIdException:
+                # Browser died behind our back (crash, manual close):
+                # drop the stale driver and retry once with a fresh one
+                self._pool.discard(driver)
+                driver = self._pool.acquire(self._headless)
+                data = _fetch_with(driver, self._url, timeout_sec=self._timeout_sec)
+        except TimeoutException:
+            self._pool.discard(driver)
+            self.signals.failed.emit("Timeout: page is slow or blocked.")
+        except WebDriverException as e:
+            self._pool.discard(driver)
+            self.signals.failed.emit(f"Selenium/WebDriver error:\n{e}")
+        except Exception as e:
+            if driver is not None:
+                self._pool.release(driver, self._headless)
+            self.signals.failed.emit(str(e))
+        else:
+            self._pool.release(driver, self._headless)
+            self.signals.finished.emit(data)
+
+
+# ----------------------------
+# GUI
+# ----------------------------
+class MainWindow(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Amazon Price Tracker")
+        self.setMinimumWidth(760)
+
+        self.last_result = None
+
+        # Warm drivers are created on first use and reused after that
+        # (cold-starting Chrome on every click costs 1-2 s per fetch).
+        # Fetches run on a bounded thread pool so the UI never blocks.
+        self._driver_pool = DriverPool()
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(5)
+
+        self.url_input = QLineEdit()
+        self.url_input.setPlaceholderText(
+            "Paste an Amazon product URL (e.g. https://www.amazon.com.tr/dp/...)"
+        )
+
+        self.target_price = QSpinBox()
+        self.target_price.setRange(0, 10_000_000)
+        self.target_price.setValue(0)
+        self.target_price.setSuffix(" target price")
+
+        self.timeout_input = QSpinBox()
+        self.timeout_input.setRange(5, 120)
+        self.timeout_input.setValue(20)
+        self.timeout_input.setSuffix(" sec timeout")
+
+        self.headless_btn = QPushButton("Headless: ON")
+        self.headless_btn.setCheckable(True)
+        self.headless_btn.setChecked(True)
+        self.headless_btn.clicked.connect(self.toggle_headless)
+
+        self.fetch_btn = QPushButton("Fetch Price")
+        self.fetch_btn.clicked.connect(self.fetch_price)
+
+        self.save_btn = QPushButton("Save to CSV")
+        self.save_btn.setEnabled(False)
+        self.save_btn.clicked.connect(self.save_history)
+
+        self.title_lbl = QLabel("Product: —")
+        self.price_lbl = QLabel("Price: —")
+        self.price_lbl.setStyleSheet("font-size: 16px; font-weight: 600;")
+
+        self.log_box = QTextEdit()
+        self.log_box.setReadOnly(True)
+
+        # Layout
+        top = QGroupBox("Input")
+        top_l = QVBoxLayout()
+
+        row1 = QHBoxLayout()
+        row1.addWidget(QLabel("URL:"))
+        row1.addWidget(self.url_input)
+
+        row2 = QHBoxLayout()
+        row2.addWidget(QLabel("Settings:"))
+        row2.addWidget(self.target_price)
+        row2.addWidget(self.timeout_input)
+        row2.addWidget(self.headless_btn)
+        row2.addStretch()
+        row2.addWidget(self.fetch_btn)
+        row2.addWidget(self.save_btn)
+
+        top_l.addLayout(row1)
+        top_l.addLayout(row2)
+        top.setLayout(top_l)
+
+        out = QGroupBox("Output")
+        out_l = QVBoxLayout()
+        out_l.addWidget(self.title_lbl)
+        out_l.addWidget(self.price_lbl)
+        out_l.addWidget(self.log_box)
+        out.setLayout(out_l)
+
+        main_l = QVBoxLayout()
+        main_l.addWidget(top)
+        main_l.addWidget(out)
+        self.setLayout(main_l)
+
+    def closeEvent(self, event):
+        # Quit the browsers first so any in-flight fetch fails fast;
+        # the workers then wind down well within the grace period
+        self._driver_pool.close_all()
+        self._thread_pool.waitForDone(3000)
+        close_history_csv()
+        super().closeEvent(event)
+
+    def toggle_headless(self):
+        self.headless_btn.setText("Headless: ON" if self.headless_btn.isChecked() else "Headless: OFF")
+
+    def log(self, msg: str):
+        self.log_box.append(msg)
+
+    def fetch_price(self):
+        url = self.url_input.text().strip()
+        if not url or not is_amazon_url(url):
+            QMessageBox.warning(self, "Invalid URL", "Please enter a valid Amazon product URL.")
+            return
+
+        # Reset UI state
+        self.fetch_btn.setEnabled(False)
+        self.save_btn.setEnabled(False)
+        self.title_lbl.setText("Product: —")
+        self.price_lbl.setText("Price: —")
+        self.last_result = None
+
+        timeout = int(self.timeout_input.value())
+        headless = bool(self.headless_btn.isChecked())
+
+        self.log(f"[{now_str()}] Fetching page...")
+
+        worker = FetchWorker(self._driver_pool, url, timeout, headless)
+        worker.signals.finished.connect(self._on_fetch_done)
+        worker.signals.failed.connect(self._on_fetch_error)
+        self._thread_pool.start(worker)
+
+    def _on_fetch_done(self, data: dict):
+        title = data.get("title") or "(title not found)"
+        price = data.get("price")
+        price_text = data.get("price_text") or ""
+        currency = data.get("currency_hint") or ""
+
+        self.last_result = data
+
+        self.title_lbl.setText(f"Product: {title}")
+        self.price_lbl.setText(f"Price: {price}  |  (raw: {price_text})")
+        self.log(f"[{now_str()}] OK — parsed price: {price} {currency}".strip())
+
+        self.save_btn.setEnabled(True)
+        self.fetch_btn.setEnabled(True)
+
+        # Target price alert
+        target = int(self.target_price.value())
+        if target > 0 and price is not None and price <= target:
+            QMessageBox.information(
+                self,
+                "Target Reached!",
+                f"Price is below your target.\n\nTarget: {target}\nCurrent: {price} {currency}".strip(),
+            )
+
+    def _on_fetch_error(self, message: str):
+        self.log(f"[{now_str()}] ERROR — {message}")
+        self.fetch_btn.setEnabled(True)
+        QMessageBox.critical(self, "Error", message)
+
+    def save_history(self):
+        if not self.last_result:
+            return
+
+        url = self.last_result["url"]
+        title = self.last_result.get("title", "")
+        price = self.last_result.get("price", "")
+        raw_price = self.last_result.get("price_text", "")
+
+        append_history_csv(url, title, price, raw_price)
+        self.log(f"[{now_str()}] Saved to data/price_history.csv")
+        QMessageBox.information(self, "Saved", "Saved to CSV (data/price_history.csv).")
+
+
+def main():
+    app = QApplication(sys.argv)
+    w = MainWindow()
+    w.show()
+    sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""
+Builds the optional compiled price parser (_price_parser.pyx):
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+The app runs fine without it; price_v2 uses the pure-Python parser
+when the extension isn't built.
+"""
+
+from setuptools import Extension, setup
+
+from Cython.Build import cythonize
+
+setup(
+    name="amazon-price-tracker-ext",
+    ext_modules=cythonize(
+        [
+            Extension(
+                "_price_parser",
+                ["_price_parser.pyx"],
+                extra_compile_args=["-O3"],
+            )
+        ],
+        language_level=3,
+    ),
+)